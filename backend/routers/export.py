@@ -1,8 +1,9 @@
 from fastapi import APIRouter, HTTPException
-from fastapi.responses import Response
+from fastapi.responses import Response, StreamingResponse
 from pydantic import BaseModel
 from typing import Dict, Any
-from utils.pdf_export import generate_analysis_pdf, generate_pdf_base64
+import io
+from utils.pdf_export import generate_analysis_pdf, generate_pdf_base64, iter_pdf_chunks
 
 router = APIRouter()
 
@@ -33,21 +34,22 @@ async def export_pdf(data: ExportRequest):
                 detail=f"Missing required analysis data fields: {', '.join(missing_fields)}"
             )
         
-        # Generate PDF
-        pdf_bytes = generate_analysis_pdf(data.analysis_data)
+        # Generate PDF into a buffer that is streamed out in chunks
+        pdf_buffer = io.BytesIO()
+        generate_analysis_pdf(data.analysis_data, pdf_buffer)
         
         # Create filename with analysis ID and timestamp
         analysis_id = data.analysis_data.get('analysis_id', 'unknown')
         timestamp = data.analysis_data.get('timestamp', '').split('T')[0]  # Get date part
         filename = f"stackstage_analysis_{analysis_id[:8]}_{timestamp}.pdf"
         
-        # Return PDF as response
-        return Response(
-            content=pdf_bytes,
+        # Stream PDF as response
+        return StreamingResponse(
+            iter_pdf_chunks(pdf_buffer),
             media_type="application/pdf",
             headers={
                 "Content-Disposition": f"attachment; filename={filename}",
-                "Content-Length": str(len(pdf_bytes))
+                "Content-Length": str(len(pdf_buffer.getvalue()))
             }
         )
         
@@ -8,7 +8,7 @@ from dotenv import load_dotenv
 
 # Import enhanced StackStage AI components
 from .code_parser import IaCCodeParser
-from .static_analyzer import StaticAnalyzer
+from .static_analyzer import get_analyzer
 from .diagram_generator import DiagramGenerator
 from .plotly_visualizer import PlotlyVisualizer
 from .local_fallback import LocalAnalysisEngine
@@ -18,7 +18,7 @@ load_dotenv()
 
 # Initialize StackStage AI components
 code_parser = IaCCodeParser()
-static_analyzer = StaticAnalyzer()
+static_analyzer = get_analyzer()
 diagram_generator = DiagramGenerator()
 plotly_visualizer = PlotlyVisualizer()
 local_fallback = LocalAnalysisEngine()
@@ -564,6 +564,7 @@ async def analyze_architecture(data) -> Dict[str, Any]:
         
         # Step 3: Generate visualizations with Plotly
         print("📊 Creating Plotly visualizations...")
+        # Dashboard charts carry their figure dicts under 'figure'; they are not part of AnalyzeResponse
         base_scores = {'overall': 75, 'security': 22, 'reliability': 23, 'performance': 15, 'cost': 15}
         plotly_charts = plotly_visualizer.create_comprehensive_dashboard({
             'score': base_scores,
@@ -7,6 +7,129 @@ import json
 from typing import Dict, List, Any, Optional
 from datetime import datetime
 
+# Static chat responses, built once at import instead of per message
+_RESPONSES: Dict[str, str] = {
+    'cost': """💰 **Cost Optimization Strategy:**
+
+**Immediate Savings (20-30%):**
+• Reserved Instances for predictable workloads
+• Spot Instances for fault-tolerant processing
+• Right-sizing based on actual usage metrics
+
+**Ongoing Optimization:**
+• Automated scaling policies
+• Storage lifecycle management (S3 → IA → Glacier)
+• Unused resource identification
+
+**FinOps Best Practices:**
+• Cost allocation tags for accountability
+• Budget alerts with automated actions
+• Regular cost reviews and optimization sprints
+
+**Typical Savings:** $500-2000/month for medium-sized infrastructure
+
+Would you like a detailed cost analysis of your current setup?""",
+
+    'performance': """⚡ **Performance Optimization Recommendations:**
+
+**Frontend Performance:**
+• CloudFront CDN for global content delivery
+• Image optimization and compression
+• Browser caching strategies
+
+**Backend Performance:**
+• ElastiCache for database query caching
+• Connection pooling and optimization
+• Async processing for non-critical tasks
+
+**Database Performance:**
+• Read replicas for query distribution
+• Query optimization and indexing
+• Connection pooling
+
+**Monitoring:**
+• CloudWatch custom metrics
+• X-Ray for distributed tracing
+• Application Performance Monitoring (APM)
+
+**Expected Improvements:** 40-60% latency reduction, 2x throughput increase""",
+
+    'reliability': """🔄 **High Availability & Disaster Recovery:**
+
+**Multi-AZ Architecture:**
+• Deploy across multiple Availability Zones
+• Auto Scaling Groups with health checks
+• Load balancer health monitoring
+
+**Database Reliability:**
+• RDS Multi-AZ with automated failover
+• Automated backups with point-in-time recovery
+• Read replicas for disaster recovery
+
+**Application Resilience:**
+• Circuit breaker patterns
+• Graceful degradation strategies
+• Automated retry mechanisms
+
+**Recovery Objectives:**
+• RPO (Recovery Point Objective): < 1 hour
+• RTO (Recovery Time Objective): < 15 minutes
+• Target Availability: 99.95% (22 minutes downtime/month)
+
+This ensures business continuity and customer satisfaction.""",
+
+    'general': """🏗️ **Cloud Architecture Best Practices:**
+
+**Design Principles:**
+• Scalability: Design for growth and variable demand
+• Reliability: Eliminate single points of failure
+• Security: Implement defense-in-depth strategies
+• Cost-Effectiveness: Optimize for your specific workload
+
+**Architecture Patterns:**
+• Microservices for large, complex applications
+• Serverless for event-driven workloads
+• Container orchestration for portable deployments
+• Multi-tier architecture for traditional applications
+
+**Key Considerations:**
+• Choose the right region for your users
+• Plan for data backup and disaster recovery
+• Implement proper monitoring and alerting
+• Regular architecture reviews and optimization
+
+I'm here to help you build confidence in your cloud infrastructure. What specific area would you like to explore?""",
+}
+
+
+# Suggestions offered with every local chat response
+_BASE_SUGGESTIONS = (
+    "🔍 Run comprehensive architecture health check",
+    "💡 Get personalized optimization recommendations",
+    "📋 Review cloud security best practices",
+    "🎯 Create improvement roadmap with priorities",
+    "🛠️ Generate Infrastructure as Code templates",
+)
+
+# Role-specific suggestions appended after the base list
+_ROLE_SUGGESTIONS = {
+    'CTO': (
+        "📊 Create executive dashboard with metrics",
+        "💰 Analyze ROI of cloud infrastructure investments",
+    ),
+    'DevOps': (
+        "🚀 Design CI/CD pipeline with automated testing",
+        "📦 Implement Infrastructure as Code best practices",
+    ),
+}
+
+# (keyword, suggestion) pairs matched against the lowercased user input
+_KEYWORD_SUGGESTIONS = (
+    ('security', "🔐 Deep dive into Zero Trust architecture"),
+    ('cost', "💰 Detailed FinOps analysis and recommendations"),
+)
+
+
 class LocalAnalysisEngine:
     """Local fallback analysis engine with rule-based intelligence"""
     
@@ -673,134 +796,26 @@ The investment in security pays dividends in preventing costly breaches and main
         
     def _generate_cost_response(self, user_input: str, role_hint: Optional[str]) -> str:
         """Generate cost optimization response"""
-        
-        return """💰 **Cost Optimization Strategy:**
-
-**Immediate Savings (20-30%):**
-• Reserved Instances for predictable workloads
-• Spot Instances for fault-tolerant processing
-• Right-sizing based on actual usage metrics
-
-**Ongoing Optimization:**
-• Automated scaling policies
-• Storage lifecycle management (S3 → IA → Glacier)
-• Unused resource identification
-
-**FinOps Best Practices:**
-• Cost allocation tags for accountability
-• Budget alerts with automated actions
-• Regular cost reviews and optimization sprints
-
-**Typical Savings:** $500-2000/month for medium-sized infrastructure
-
-Would you like a detailed cost analysis of your current setup?"""
+        return _RESPONSES['cost']
 
     def _generate_performance_response(self, user_input: str, role_hint: Optional[str]) -> str:
         """Generate performance optimization response"""
-        
-        return """⚡ **Performance Optimization Recommendations:**
-
-**Frontend Performance:**
-• CloudFront CDN for global content delivery
-• Image optimization and compression
-• Browser caching strategies
-
-**Backend Performance:**
-• ElastiCache for database query caching
-• Connection pooling and optimization
-• Async processing for non-critical tasks
-
-**Database Performance:**
-• Read replicas for query distribution
-• Query optimization and indexing
-• Connection pooling
-
-**Monitoring:**
-• CloudWatch custom metrics
-• X-Ray for distributed tracing
-• Application Performance Monitoring (APM)
-
-**Expected Improvements:** 40-60% latency reduction, 2x throughput increase"""
+        return _RESPONSES['performance']
 
     def _generate_reliability_response(self, user_input: str, role_hint: Optional[str]) -> str:
         """Generate reliability and availability response"""
-        
-        return """🔄 **High Availability & Disaster Recovery:**
-
-**Multi-AZ Architecture:**
-• Deploy across multiple Availability Zones
-• Auto Scaling Groups with health checks
-• Load balancer health monitoring
-
-**Database Reliability:**
-• RDS Multi-AZ with automated failover
-• Automated backups with point-in-time recovery
-• Read replicas for disaster recovery
-
-**Application Resilience:**
-• Circuit breaker patterns
-• Graceful degradation strategies
-• Automated retry mechanisms
-
-**Recovery Objectives:**
-• RPO (Recovery Point Objective): < 1 hour
-• RTO (Recovery Time Objective): < 15 minutes
-• Target Availability: 99.95% (22 minutes downtime/month)
-
-This ensures business continuity and customer satisfaction."""
+        return _RESPONSES['reliability']
 
     def _generate_general_response(self, user_input: str, role_hint: Optional[str]) -> str:
         """Generate general architecture response"""
-        
-        return """🏗️ **Cloud Architecture Best Practices:**
-
-**Design Principles:**
-• Scalability: Design for growth and variable demand
-• Reliability: Eliminate single points of failure
-• Security: Implement defense-in-depth strategies
-• Cost-Effectiveness: Optimize for your specific workload
-
-**Architecture Patterns:**
-• Microservices for large, complex applications
-• Serverless for event-driven workloads
-• Container orchestration for portable deployments
-• Multi-tier architecture for traditional applications
-
-**Key Considerations:**
-• Choose the right region for your users
-• Plan for data backup and disaster recovery
-• Implement proper monitoring and alerting
-• Regular architecture reviews and optimization
-
-I'm here to help you build confidence in your cloud infrastructure. What specific area would you like to explore?"""
+        return _RESPONSES['general']
 
     def _generate_contextual_suggestions(self, user_input: str, role_hint: Optional[str]) -> List[str]:
         """Generate contextual suggestions based on input and role"""
         
-        base_suggestions = [
-            "🔍 Run comprehensive architecture health check",
-            "💡 Get personalized optimization recommendations", 
-            "📋 Review cloud security best practices",
-            "🎯 Create improvement roadmap with priorities",
-            "🛠️ Generate Infrastructure as Code templates"
-        ]
+        suggestions = _BASE_SUGGESTIONS + _ROLE_SUGGESTIONS.get(role_hint, ())
         
-        # Add role-specific suggestions
-        if role_hint == 'CTO':
-            base_suggestions.extend([
-                "📊 Create executive dashboard with metrics",
-                "💰 Analyze ROI of cloud infrastructure investments"
-            ])
-        elif role_hint == 'DevOps':
-            base_suggestions.extend([
-                "🚀 Design CI/CD pipeline with automated testing",
-                "📦 Implement Infrastructure as Code best practices"
-            ])
-        
-        # Add contextual suggestions based on input
-        if 'security' in user_input:
-            base_suggestions.append("🔐 Deep dive into Zero Trust architecture")
-        if 'cost' in user_input:
-            base_suggestions.append("💰 Detailed FinOps analysis and recommendations")
-        
-        return base_suggestions[:5]  # Return top 5 suggestions
\ No newline at end of file
+        # Add contextual suggestions based on input (already lowercased by chat_response_local)
+        suggestions += tuple(suggestion for keyword, suggestion in _KEYWORD_SUGGESTIONS if keyword in user_input)
+        
+        return list(suggestions[:5])  # Return top 5 suggestions
\ No newline at end of file
@@ -2,47 +2,250 @@
 StackStage Plotly Visualization Engine
 Creates interactive charts and visualizations for architecture health scoring
 """
+import hashlib
 import json
-import plotly.graph_objects as go
-import plotly.express as px
-from plotly.subplots import make_subplots
-import pandas as pd
-from typing import Dict, List, Any, Optional
-import numpy as np
+import threading
+import uuid
+from bisect import bisect_right
+from collections import Counter, OrderedDict
+from functools import lru_cache
+from string import Template
+from types import MappingProxyType
+import plotly.io as pio
+from typing import Dict, List, Any, Optional, Tuple
+
+# numpy and plotly.subplots are imported inside the functions that use
+# them so importing this module (and worker start-up) stays cheap
+
+try:
+    import orjson
+    PLOTLY_JSON_ENGINE = 'orjson'
+    _json_loads = orjson.loads
+except ImportError:
+    orjson = None
+    PLOTLY_JSON_ENGINE = 'json'
+    _json_loads = json.loads
+pio.json.config.default_engine = PLOTLY_JSON_ENGINE
+
+# Template embedded in every chart layout (see _template_json)
+PLOTLY_TEMPLATE = 'plotly_white'
+
+# StackStage brand colors
+COLORS = MappingProxyType({
+    'primary': '#74b9ff',      # Blue
+    'secondary': '#fd79a8',    # Pink
+    'success': '#55efc4',      # Green
+    'warning': '#fdcb6e',      # Yellow
+    'danger': '#ff6b6b',       # Red
+    'info': '#a29bfe',         # Purple
+    'dark': '#2d3436',         # Dark Gray
+    'light': '#ddd'            # Light Gray
+})
+
+GRADIENT_COLORS = MappingProxyType({
+    'security': ('#ff6b6b', '#fd79a8', '#fdcb6e', '#55efc4'),
+    'performance': ('#74b9ff', '#a29bfe', '#fd79a8', '#55efc4'),
+    'cost': ('#fdcb6e', '#fd79a8', '#74b9ff', '#55efc4'),
+    'reliability': ('#a29bfe', '#74b9ff', '#55efc4', '#00b894')
+})
+
+# Professional styling, spread into every chart layout
+LAYOUT_THEME = MappingProxyType({
+    'font': {'family': 'Inter, Arial, sans-serif', 'size': 12},
+    'colorway': tuple(COLORS.values()),
+    'paper_bgcolor': 'white',
+    'plot_bgcolor': 'rgba(0,0,0,0)'
+})
+
+_SEVERITY_ORDER = ('critical', 'high', 'medium', 'low', 'info')
+_SEVERITY_COLORS = MappingProxyType({
+    'critical': COLORS['danger'],
+    'high': '#ff8f39',
+    'medium': COLORS['warning'],
+    'low': COLORS['info'],
+    'info': COLORS['light']
+})
+
+# Score bands, lowest first: bisect_right(thresholds, score) indexes the matching grade/colour
+_GRADE_THRESHOLDS = (60, 70, 80, 90)
+_GRADES = ('F', 'D', 'C', 'B', 'A')
+_SCORE_COLOR_THRESHOLDS = (60, 80)
+_SCORE_COLORS = (COLORS['danger'], COLORS['warning'], COLORS['success'])
+
+# Red/amber/green bands behind each health gauge, keyed by the gauge maximum
+_GAUGE_STEPS_100 = (
+    {'range': (0, 50), 'color': "rgba(255, 107, 107, 0.2)"},
+    {'range': (50, 80), 'color': "rgba(253, 203, 110, 0.2)"},
+    {'range': (80, 100), 'color': "rgba(85, 239, 196, 0.2)"}
+)
+_GAUGE_STEPS_30 = (
+    {'range': (0, 15), 'color': "rgba(255, 107, 107, 0.2)"},
+    {'range': (15, 25), 'color': "rgba(253, 203, 110, 0.2)"},
+    {'range': (25, 30), 'color': "rgba(85, 239, 196, 0.2)"}
+)
+_GAUGE_STEPS_20 = (
+    {'range': (0, 10), 'color': "rgba(255, 107, 107, 0.2)"},
+    {'range': (10, 16), 'color': "rgba(253, 203, 110, 0.2)"},
+    {'range': (16, 20), 'color': "rgba(85, 239, 196, 0.2)"}
+)
+
+_SERVICE_COLORS = (
+    COLORS['primary'],
+    COLORS['secondary'],
+    COLORS['info'],
+    COLORS['warning'],
+    COLORS['success']
+)
+
+# Share of the monthly cost assigned to each service when no breakdown is given
+_DEFAULT_COST_SHARES = {
+    'compute': 0.4,
+    'storage': 0.25,
+    'network': 0.2,
+    'security': 0.15
+}
+
+_DEFAULT_FRAMEWORK_SCORES = {
+    'SOC2': {'score': 78, 'status': 'partially_compliant'},
+    'GDPR': {'score': 85, 'status': 'compliant'},
+    'HIPAA': {'score': 72, 'status': 'partially_compliant'},
+    'PCI_DSS': {'score': 68, 'status': 'non_compliant'}
+}
+
+_PERFORMANCE_METRICS = ('response_time', 'throughput', 'error_rate', 'availability')
+# Typical value of each metric: centre of the sample trend and the summary for metrics with no data
+_PERFORMANCE_DEFAULTS = (200, 1000, 2, 99.5)
+
+@lru_cache(maxsize=1)
+def _default_performance_data() -> Tuple[List[str], Any]:
+    """Sample 30-day performance trend, generated once per process.
+    
+    Returns the date labels and a read-only (metric, day) numpy array
+    ordered like _PERFORMANCE_METRICS.
+    """
+    import numpy as np
+    
+    rng = np.random.default_rng(0)
+    samples = rng.normal(
+        loc=_PERFORMANCE_DEFAULTS,
+        scale=[50, 100, 0.5, 0.3],
+        size=(30, 4)
+    ).T
+    samples.flags.writeable = False
+    start = np.datetime64('2024-01-01')
+    dates = np.arange(start, start + 30).astype(str).tolist()
+    return dates, samples
+
+# Dashboards are deterministic in their inputs, so repeat requests for the same
+# analysis reuse the charts; LRU-bounded like the PDF report cache
+DASHBOARD_CACHE_SIZE = 128
+_DASHBOARD_CACHE: "OrderedDict[bytes, str]" = OrderedDict()
+_DASHBOARD_CACHE_LOCK = threading.Lock()
+
+def _dashboard_cache_key(analysis_results: Dict[str, Any]) -> bytes:
+    """Stable digest of the dashboard inputs, independent of dict ordering"""
+    if orjson is not None:
+        payload = orjson.dumps(analysis_results, default=str,
+                               option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS)
+    else:
+        payload = json.dumps(analysis_results, sort_keys=True, default=str).encode('utf-8')
+    return hashlib.blake2b(payload, digest_size=16).digest()
+
+def _dashboard_cache_lookup(cache_key: bytes) -> Optional[str]:
+    """Return a cached encoded dashboard and mark it most recently used, or None on a miss"""
+    with _DASHBOARD_CACHE_LOCK:
+        cached = _DASHBOARD_CACHE.get(cache_key)
+        if cached is not None:
+            _DASHBOARD_CACHE.move_to_end(cache_key)
+        return cached
+
+def _dashboard_cache_store(cache_key: bytes, dashboard: str) -> None:
+    """Add a dashboard to the LRU cache, evicting the least recently used beyond DASHBOARD_CACHE_SIZE"""
+    with _DASHBOARD_CACHE_LOCK:
+        _DASHBOARD_CACHE[cache_key] = dashboard
+        if len(_DASHBOARD_CACHE) > DASHBOARD_CACHE_SIZE:
+            _DASHBOARD_CACHE.popitem(last=False)
+
+@lru_cache(maxsize=1)
+def _template_text() -> str:
+    """Default template encoded once; each layout decodes its own copy"""
+    return pio.json.to_json_plotly(pio.templates[PLOTLY_TEMPLATE].to_plotly_json())
+
+def _template_json() -> Dict[str, Any]:
+    """Fresh copy of the default template as plain dicts (decoding beats deepcopy)"""
+    return _json_loads(_template_text())
+
+def _base_layout() -> Dict[str, Any]:
+    """Fresh layout dict for a single-plot chart"""
+    return {'template': _template_json()}
+
+def _subplot_grid(**subplot_kwargs) -> Tuple[Dict[str, Any], Dict[Tuple[int, int], Dict[str, Any]]]:
+    """Lay out a make_subplots grid as plain dicts.
+    
+    Returns a fresh layout (axes, domains, subplot titles) and, per (row, col)
+    cell, the keys that anchor a raw trace dict to that subplot. Each builder
+    always asks for the same grid, so the grid is computed once per distinct
+    set of arguments and kept encoded; every call decodes its own copy, so
+    callers may mutate the result freely.
+    """
+    layout_text, cells_text = _compute_subplot_grid(json.dumps(subplot_kwargs, sort_keys=True))
+    layout = _json_loads(layout_text)
+    layout['template'] = _template_json()
+    cells = {(row, col): anchor for (row, col), anchor in _json_loads(cells_text)}
+    return layout, cells
+
+@lru_cache(maxsize=None)
+def _compute_subplot_grid(subplot_key: str) -> Tuple[str, str]:
+    """Encoded (layout without template, [[(row, col), anchor], ...]) for a subplot grid"""
+    from plotly.subplots import make_subplots
+    
+    subplot_kwargs = json.loads(subplot_key)
+    fig = make_subplots(**subplot_kwargs)
+    cells = []
+    for row in range(1, subplot_kwargs['rows'] + 1):
+        for col in range(1, subplot_kwargs['cols'] + 1):
+            subplot = fig.get_subplot(row, col)
+            if subplot is None:
+                continue
+            if hasattr(subplot, 'xaxis'):
+                cells.append([[row, col], {
+                    'xaxis': subplot.xaxis.plotly_name.replace('axis', ''),
+                    'yaxis': subplot.yaxis.plotly_name.replace('axis', '')
+                }])
+            else:
+                cells.append([[row, col], {'domain': {'x': list(subplot.x), 'y': list(subplot.y)}}])
+    layout = fig.layout.to_plotly_json()
+    layout.pop('template', None)
+    return pio.json.to_json_plotly(layout), pio.json.to_json_plotly(cells)
+
+@lru_cache(maxsize=1)
+def _html_template() -> Template:
+    """Plotly's CDN HTML wrapper, rendered once with substitution slots.
+    
+    to_html hashes the bundled plotly.js for the CDN integrity attribute on
+    every call; only the div id, height and figure JSON differ per chart.
+    """
+    data = ['__PLOTLY_DATA__']
+    layout = {'height': '__PLOTLY_HEIGHT__'}
+    html = pio.to_html({'data': data, 'layout': layout}, include_plotlyjs='cdn',
+                       div_id='__PLOTLY_DIV_ID__', validate=False)
+    html = html.replace('$', '$$')
+    for token, slot in ((pio.json.to_json_plotly(data), 'data'),
+                        (pio.json.to_json_plotly(layout), 'layout'),
+                        ('__PLOTLY_DIV_ID__', 'div_id'),
+                        ('__PLOTLY_HEIGHT__', 'height')):
+        html = html.replace(token, '${%s}' % slot)
+    return Template(html)
 
 class PlotlyVisualizer:
     """Professional visualization engine using Plotly for StackStage analytics"""
     
-    def __init__(self):
-        # StackStage brand colors
-        self.colors = {
-            'primary': '#74b9ff',      # Blue
-            'secondary': '#fd79a8',    # Pink
-            'success': '#55efc4',      # Green
-            'warning': '#fdcb6e',      # Yellow
-            'danger': '#ff6b6b',       # Red
-            'info': '#a29bfe',         # Purple
-            'dark': '#2d3436',         # Dark Gray
-            'light': '#ddd'            # Light Gray
-        }
-        
-        self.gradient_colors = {
-            'security': ['#ff6b6b', '#fd79a8', '#fdcb6e', '#55efc4'],
-            'performance': ['#74b9ff', '#a29bfe', '#fd79a8', '#55efc4'],
-            'cost': ['#fdcb6e', '#fd79a8', '#74b9ff', '#55efc4'],
-            'reliability': ['#a29bfe', '#74b9ff', '#55efc4', '#00b894']
-        }
-        
-        # Professional styling
-        self.layout_theme = {
-            'template': 'plotly_white',
-            'font': {'family': 'Inter, Arial, sans-serif', 'size': 12},
-            'colorway': list(self.colors.values()),
-            'paper_bgcolor': 'white',
-            'plot_bgcolor': 'rgba(0,0,0,0)'
-        }
+    colors = COLORS
+    gradient_colors = GRADIENT_COLORS
+    layout_theme = LAYOUT_THEME
     
-    def create_architecture_health_score_chart(self, scores: Dict[str, int]) -> Dict[str, Any]:
+    def create_architecture_health_score_chart(self, scores: Dict[str, int], include_html: bool = False,
+                                               serialize: bool = True) -> Dict[str, Any]:
         """Create comprehensive architecture health score visualization"""
         
         # Extract scores with defaults
@@ -53,7 +256,7 @@ class PlotlyVisualizer:
         cost_score = scores.get('cost', 15)
         
         # Create subplot layout
-        fig = make_subplots(
+        layout, cells = _subplot_grid(
             rows=2, cols=3,
             specs=[
                 [{"type": "indicator"}, {"type": "indicator"}, {"type": "indicator"}],
@@ -64,108 +267,81 @@ class PlotlyVisualizer:
             horizontal_spacing=0.1
         )
         
-        # Overall Score - Large gauge
-        fig.add_trace(
-            go.Indicator(
+        data = [
+            # Overall Score - Large gauge
+            dict(
+                type='indicator',
                 mode="gauge+number+delta",
                 value=overall_score,
                 title={'text': "Architecture Health"},
                 gauge={
                     'axis': {'range': [None, 100]},
                     'bar': {'color': self._get_score_color(overall_score)},
-                    'steps': [
-                        {'range': [0, 50], 'color': "rgba(255, 107, 107, 0.2)"},
-                        {'range': [50, 80], 'color': "rgba(253, 203, 110, 0.2)"},
-                        {'range': [80, 100], 'color': "rgba(85, 239, 196, 0.2)"}
-                    ],
+                    'steps': _GAUGE_STEPS_100,
                     'threshold': {
                         'line': {'color': "red", 'width': 4},
                         'thickness': 0.75,
                         'value': 90
                     }
-                }
+                },
+                **cells[1, 1]
             ),
-            row=1, col=1
-        )
-        
-        # Security Score
-        fig.add_trace(
-            go.Indicator(
+            # Security Score
+            dict(
+                type='indicator',
                 mode="gauge+number",
                 value=security_score,
                 title={'text': f"Security<br><span style='font-size:0.8em'>/{30} max</span>"},
                 gauge={
                     'axis': {'range': [None, 30]},
-                    'bar': {'color': self.colors['danger']},
-                    'steps': [
-                        {'range': [0, 15], 'color': "rgba(255, 107, 107, 0.2)"},
-                        {'range': [15, 25], 'color': "rgba(253, 203, 110, 0.2)"},
-                        {'range': [25, 30], 'color': "rgba(85, 239, 196, 0.2)"}
-                    ]
-                }
+                    'bar': {'color': COLORS['danger']},
+                    'steps': _GAUGE_STEPS_30
+                },
+                **cells[1, 2]
             ),
-            row=1, col=2
-        )
-        
-        # Reliability Score
-        fig.add_trace(
-            go.Indicator(
+            # Reliability Score
+            dict(
+                type='indicator',
                 mode="gauge+number",
                 value=reliability_score,
                 title={'text': f"Reliability<br><span style='font-size:0.8em'>/{30} max</span>"},
                 gauge={
                     'axis': {'range': [None, 30]},
-                    'bar': {'color': self.colors['primary']},
-                    'steps': [
-                        {'range': [0, 15], 'color': "rgba(255, 107, 107, 0.2)"},
-                        {'range': [15, 25], 'color': "rgba(253, 203, 110, 0.2)"},
-                        {'range': [25, 30], 'color': "rgba(85, 239, 196, 0.2)"}
-                    ]
-                }
+                    'bar': {'color': COLORS['primary']},
+                    'steps': _GAUGE_STEPS_30
+                },
+                **cells[1, 3]
             ),
-            row=1, col=3
-        )
-        
-        # Performance Score
-        fig.add_trace(
-            go.Indicator(
+            # Performance Score
+            dict(
+                type='indicator',
                 mode="gauge+number",
                 value=performance_score,
                 title={'text': f"Performance<br><span style='font-size:0.8em'>/{20} max</span>"},
                 gauge={
                     'axis': {'range': [None, 20]},
-                    'bar': {'color': self.colors['info']},
-                    'steps': [
-                        {'range': [0, 10], 'color': "rgba(255, 107, 107, 0.2)"},
-                        {'range': [10, 16], 'color': "rgba(253, 203, 110, 0.2)"},
-                        {'range': [16, 20], 'color': "rgba(85, 239, 196, 0.2)"}
-                    ]
-                }
+                    'bar': {'color': COLORS['info']},
+                    'steps': _GAUGE_STEPS_20
+                },
+                **cells[2, 1]
             ),
-            row=2, col=1
-        )
-        
-        # Cost Score
-        fig.add_trace(
-            go.Indicator(
+            # Cost Score
+            dict(
+                type='indicator',
                 mode="gauge+number",
                 value=cost_score,
                 title={'text': f"Cost Efficiency<br><span style='font-size:0.8em'>/{20} max</span>"},
                 gauge={
                     'axis': {'range': [None, 20]},
-                    'bar': {'color': self.colors['warning']},
-                    'steps': [
-                        {'range': [0, 10], 'color': "rgba(255, 107, 107, 0.2)"},
-                        {'range': [10, 16], 'color': "rgba(253, 203, 110, 0.2)"},
-                        {'range': [16, 20], 'color': "rgba(85, 239, 196, 0.2)"}
-                    ]
-                }
-            ),
-            row=2, col=2
-        )
+                    'bar': {'color': COLORS['warning']},
+                    'steps': _GAUGE_STEPS_20
+                },
+                **cells[2, 2]
+            )
+        ]
         
         # Update layout
-        fig.update_layout(
+        layout.update(
             title={
                 'text': 'StackStage Architecture Health Dashboard',
                 'x': 0.5,
@@ -173,128 +349,100 @@ class PlotlyVisualizer:
             },
             height=600,
             showlegend=False,
-            **self.layout_theme
+            **LAYOUT_THEME
         )
         
-        return {
-            'chart_type': 'health_dashboard',
-            'plotly_json': fig.to_json(),
-            'html': fig.to_html(include_plotlyjs='cdn'),
-            'summary': {
-                'overall_score': overall_score,
-                'grade': self._get_grade(overall_score),
-                'total_possible': 100
-            }
-        }
+        return self._chart_result('health_dashboard', {'data': data, 'layout': layout}, include_html, serialize, {
+            'overall_score': overall_score,
+            'grade': self._get_grade(overall_score),
+            'total_possible': 100
+        })
     
-    def create_issues_severity_chart(self, issues: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def create_issues_severity_chart(self, issues: List[Dict[str, Any]], include_html: bool = False,
+                                     serialize: bool = True) -> Dict[str, Any]:
         """Create issues breakdown by severity chart"""
         
         if not issues:
             # Create empty state chart
-            fig = go.Figure()
-            fig.add_annotation(
-                text="No issues detected in your architecture! 🎉",
-                xref="paper", yref="paper",
-                x=0.5, y=0.5,
-                showarrow=False,
-                font={'size': 18, 'color': self.colors['success']}
+            layout = _base_layout()
+            layout.update(
+                annotations=[{
+                    'text': "No issues detected in your architecture! 🎉",
+                    'xref': "paper", 'yref': "paper",
+                    'x': 0.5, 'y': 0.5,
+                    'showarrow': False,
+                    'font': {'size': 18, 'color': COLORS['success']}
+                }],
+                title={'text': "Security & Compliance Issues"},
+                **LAYOUT_THEME
             )
-            fig.update_layout(
-                title="Security & Compliance Issues",
-                **self.layout_theme
-            )
-            return {
-                'chart_type': 'issues_severity',
-                'plotly_json': fig.to_json(),
-                'html': fig.to_html(include_plotlyjs='cdn'),
-                'summary': {'total_issues': 0, 'status': 'healthy'}
-            }
+            return self._chart_result('issues_severity', {'data': [], 'layout': layout}, include_html, serialize, {
+                'total_issues': 0,
+                'status': 'healthy'
+            })
         
         # Count issues by severity
-        severity_counts = {}
-        for issue in issues:
-            severity = issue.get('severity', 'medium').lower()
-            severity_counts[severity] = severity_counts.get(severity, 0) + 1
-        
-        # Define severity order and colors
-        severity_order = ['critical', 'high', 'medium', 'low', 'info']
-        severity_colors = {
-            'critical': self.colors['danger'],
-            'high': '#ff8f39',
-            'medium': self.colors['warning'], 
-            'low': self.colors['info'],
-            'info': self.colors['light']
-        }
-        
-        # Prepare data
-        severities = []
-        counts = []
-        colors = []
+        severity_counts = Counter(str(issue.get('severity', 'medium')).lower() for issue in issues)
         
-        for severity in severity_order:
-            if severity in severity_counts:
-                severities.append(severity.title())
-                counts.append(severity_counts[severity])
-                colors.append(severity_colors[severity])
+        # Prepare data in canonical severity order, skipping absent levels
+        present = [severity for severity in _SEVERITY_ORDER if severity in severity_counts]
+        severities = [severity.title() for severity in present]
+        counts = [severity_counts[severity] for severity in present]
+        colors = [_SEVERITY_COLORS[severity] for severity in present]
         
         # Create combined chart
-        fig = make_subplots(
+        layout, cells = _subplot_grid(
             rows=1, cols=2,
             specs=[[{"type": "pie"}, {"type": "bar"}]],
             subplot_titles=("Issues Distribution", "Severity Breakdown"),
             horizontal_spacing=0.1
         )
         
-        # Pie chart
-        fig.add_trace(
-            go.Pie(
+        data = [
+            # Pie chart
+            dict(
+                type='pie',
                 labels=severities,
                 values=counts,
                 hole=0.4,
-                marker_colors=colors,
+                marker={'colors': colors},
                 textinfo='label+percent',
-                textposition='outside'
+                textposition='outside',
+                **cells[1, 1]
             ),
-            row=1, col=1
-        )
-        
-        # Bar chart
-        fig.add_trace(
-            go.Bar(
+            # Bar chart
+            dict(
+                type='bar',
                 x=severities,
                 y=counts,
-                marker_color=colors,
-                text=counts,
+                marker={'color': colors},
+                text=[str(count) for count in counts],
                 textposition='auto',
-                name='Issues'
-            ),
-            row=1, col=2
-        )
+                name='Issues',
+                **cells[1, 2]
+            )
+        ]
         
-        fig.update_layout(
+        layout.update(
             title={
                 'text': f'Security & Compliance Issues Analysis ({sum(counts)} total)',
                 'x': 0.5
             },
             height=400,
             showlegend=False,
-            **self.layout_theme
+            **LAYOUT_THEME
         )
         
-        return {
-            'chart_type': 'issues_severity',
-            'plotly_json': fig.to_json(),
-            'html': fig.to_html(include_plotlyjs='cdn'),
-            'summary': {
-                'total_issues': sum(counts),
-                'critical_issues': severity_counts.get('critical', 0),
-                'status': 'critical' if severity_counts.get('critical', 0) > 0 else 'needs_attention'
-            }
-        }
+        return self._chart_result('issues_severity', {'data': data, 'layout': layout}, include_html, serialize, {
+            'total_issues': sum(counts),
+            'critical_issues': severity_counts.get('critical', 0),
+            'status': 'critical' if severity_counts.get('critical', 0) > 0 else 'needs_attention'
+        })
     
-    def create_cost_breakdown_chart(self, cost_data: Dict[str, Any]) -> Dict[str, Any]:
+    def create_cost_breakdown_chart(self, cost_data: Dict[str, Any], include_html: bool = False,
+                                    serialize: bool = True) -> Dict[str, Any]:
         """Create cost analysis and breakdown visualization"""
+        import numpy as np
         
         breakdown = cost_data.get('breakdown', {})
         total_cost = cost_data.get('monthly', 750)
@@ -304,18 +452,16 @@ class PlotlyVisualizer:
         if not breakdown:
             # Default breakdown if none provided
             breakdown = {
-                'compute': total_cost * 0.4,
-                'storage': total_cost * 0.25,
-                'network': total_cost * 0.2,
-                'security': total_cost * 0.15
+                service: total_cost * share
+                for service, share in _DEFAULT_COST_SHARES.items()
             }
         
         # Create subplots
-        fig = make_subplots(
+        layout, cells = _subplot_grid(
             rows=2, cols=2,
             specs=[
                 [{"type": "pie"}, {"type": "bar"}],
-                [{"colspan": 2, "type": "scatter"}]
+                [{"colspan": 2, "type": "scatter"}, None]
             ],
             subplot_titles=(
                 "Cost Breakdown by Service",
@@ -329,40 +475,6 @@ class PlotlyVisualizer:
         # Prepare data
         services = list(breakdown.keys())
         costs = [float(breakdown[service]) for service in services]
-        service_colors = [
-            self.colors['primary'],
-            self.colors['secondary'],
-            self.colors['info'],
-            self.colors['warning'],
-            self.colors['success']
-        ]
-        
-        # Pie chart - Cost breakdown
-        fig.add_trace(
-            go.Pie(
-                labels=[service.title() for service in services],
-                values=costs,
-                hole=0.4,
-                marker_colors=service_colors[:len(services)],
-                textinfo='label+percent+value',
-                texttemplate='%{label}<br>%{percent}<br>$%{value:.0f}',
-                textposition='outside'
-            ),
-            row=1, col=1
-        )
-        
-        # Bar chart - Service costs
-        fig.add_trace(
-            go.Bar(
-                x=[service.title() for service in services],
-                y=costs,
-                marker_color=service_colors[:len(services)],
-                text=[f'${cost:.0f}' for cost in costs],
-                textposition='auto',
-                name='Monthly Cost'
-            ),
-            row=1, col=2
-        )
         
         # Cost optimization waterfall
         optimization_data = {
@@ -375,90 +487,94 @@ class PlotlyVisualizer:
         }
         
         x_vals = list(optimization_data.keys())
-        y_vals = list(optimization_data.values())
-        
-        # Calculate cumulative for waterfall effect
-        cumulative = [y_vals[0]]
-        for i in range(1, len(y_vals) - 1):
-            cumulative.append(cumulative[-1] + y_vals[i])
-        cumulative.append(y_vals[-1])  # Final optimized cost
-        
-        colors = ['blue'] + ['red' if val < 0 else 'green' for val in y_vals[1:-1]] + ['green']
-        
-        fig.add_trace(
-            go.Scatter(
+        y_vals = np.fromiter(optimization_data.values(), dtype=float, count=len(optimization_data))
+        
+        # Calculate cumulative for waterfall effect; the last point is the final optimized cost
+        cumulative = np.cumsum(y_vals)
+        cumulative[-1] = y_vals[-1]
+        
+        # Start blue, end green; steps red for savings and green for increases
+        colors = np.where(y_vals < 0, 'red', 'green').astype(object)
+        colors[0] = 'blue'
+        colors[-1] = 'green'
+        bar_colors = np.full(len(y_vals), 'red', dtype=object)
+        bar_colors[0] = 'blue'
+        bar_colors[-1] = 'green'
+        
+        data = [
+            # Pie chart - Cost breakdown
+            dict(
+                type='pie',
+                labels=[service.title() for service in services],
+                values=costs,
+                hole=0.4,
+                marker={'colors': _SERVICE_COLORS[:len(services)]},
+                textinfo='label+percent+value',
+                texttemplate='%{label}<br>%{percent}<br>$%{value:.0f}',
+                textposition='outside',
+                **cells[1, 1]
+            ),
+            # Bar chart - Service costs
+            dict(
+                type='bar',
+                x=[service.title() for service in services],
+                y=costs,
+                marker={'color': _SERVICE_COLORS[:len(services)]},
+                text=[f'${cost:.0f}' for cost in costs],
+                textposition='auto',
+                name='Monthly Cost',
+                **cells[1, 2]
+            ),
+            # Cumulative cost line
+            dict(
+                type='scatter',
                 x=x_vals,
-                y=cumulative,
+                y=cumulative.tolist(),
                 mode='lines+markers+text',
                 line=dict(color='gray', width=2),
-                marker=dict(size=10, color=colors),
+                marker=dict(size=10, color=colors.tolist()),
                 text=[f'${val:.0f}' for val in cumulative],
                 textposition='top center',
-                name='Cost Impact'
+                name='Cost Impact',
+                **cells[2, 1]
             ),
-            row=2, col=1
-        )
-        
-        # Add bars for waterfall visualization
-        for i, (label, value) in enumerate(optimization_data.items()):
-            if i == 0 or i == len(optimization_data) - 1:
-                # Start and end points
-                fig.add_trace(
-                    go.Bar(
-                        x=[label],
-                        y=[abs(value)],
-                        marker_color='blue' if i == 0 else 'green',
-                        showlegend=False
-                    ),
-                    row=2, col=1
-                )
-            else:
-                # Optimization steps
-                fig.add_trace(
-                    go.Bar(
-                        x=[label],
-                        y=[abs(value)],
-                        marker_color='red',
-                        showlegend=False
-                    ),
-                    row=2, col=1
-                )
+            # Waterfall bars as a single trace
+            dict(
+                type='bar',
+                x=x_vals,
+                y=np.abs(y_vals).tolist(),
+                marker={'color': bar_colors.tolist()},
+                showlegend=False,
+                **cells[2, 1]
+            )
+        ]
         
-        fig.update_layout(
+        layout.update(
             title={
                 'text': f'Cost Analysis Dashboard - ${total_cost:.0f} {currency}/month',
                 'x': 0.5
             },
             height=800,
             showlegend=False,
-            **self.layout_theme
+            **LAYOUT_THEME
         )
         
-        return {
-            'chart_type': 'cost_analysis',
-            'plotly_json': fig.to_json(),
-            'html': fig.to_html(include_plotlyjs='cdn'),
-            'summary': {
-                'total_monthly_cost': total_cost,
-                'optimization_potential': optimization_potential,
-                'potential_savings_percent': round((optimization_potential / total_cost) * 100, 1),
-                'currency': currency
-            }
-        }
+        return self._chart_result('cost_analysis', {'data': data, 'layout': layout}, include_html, serialize, {
+            'total_monthly_cost': total_cost,
+            'optimization_potential': optimization_potential,
+            'potential_savings_percent': round((optimization_potential / total_cost) * 100, 1),
+            'currency': currency
+        })
     
-    def create_compliance_radar_chart(self, compliance_data: Dict[str, Any]) -> Dict[str, Any]:
+    def create_compliance_radar_chart(self, compliance_data: Dict[str, Any], include_html: bool = False,
+                                      serialize: bool = True) -> Dict[str, Any]:
         """Create compliance framework radar chart"""
         
         framework_scores = compliance_data.get('framework_scores', {})
         
         if not framework_scores:
             # Default compliance scores
-            framework_scores = {
-                'SOC2': {'score': 78, 'status': 'partially_compliant'},
-                'GDPR': {'score': 85, 'status': 'compliant'},
-                'HIPAA': {'score': 72, 'status': 'partially_compliant'},
-                'PCI_DSS': {'score': 68, 'status': 'non_compliant'}
-            }
+            framework_scores = _DEFAULT_FRAMEWORK_SCORES
         
         # Prepare data for radar chart
         frameworks = list(framework_scores.keys())
@@ -468,34 +584,31 @@ class PlotlyVisualizer:
         frameworks.append(frameworks[0])
         scores.append(scores[0])
         
-        fig = go.Figure()
-        
-        # Add radar trace
-        fig.add_trace(
-            go.Scatterpolar(
+        data = [
+            # Radar trace
+            dict(
+                type='scatterpolar',
                 r=scores,
                 theta=frameworks,
                 fill='toself',
                 fillcolor='rgba(116, 185, 255, 0.2)',
-                line=dict(color=self.colors['primary'], width=3),
-                marker=dict(size=8, color=self.colors['primary']),
+                line=dict(color=COLORS['primary'], width=3),
+                marker=dict(size=8, color=COLORS['primary']),
                 name='Compliance Score'
-            )
-        )
-        
-        # Add ideal score line
-        ideal_scores = [100] * len(frameworks)
-        fig.add_trace(
-            go.Scatterpolar(
-                r=ideal_scores,
+            ),
+            # Ideal score line
+            dict(
+                type='scatterpolar',
+                r=[100] * len(frameworks),
                 theta=frameworks,
-                line=dict(color=self.colors['success'], width=2, dash='dash'),
+                line=dict(color=COLORS['success'], width=2, dash='dash'),
                 name='Target Score (100)',
                 showlegend=True
             )
-        )
+        ]
         
-        fig.update_layout(
+        layout = _base_layout()
+        layout.update(
             polar=dict(
                 radialaxis=dict(
                     visible=True,
@@ -513,44 +626,36 @@ class PlotlyVisualizer:
                 'font': {'size': 18}
             },
             height=500,
-            **self.layout_theme
+            **LAYOUT_THEME
         )
         
         # Calculate overall compliance
         overall_compliance = sum(scores[:-1]) / (len(scores) - 1)  # Exclude duplicate first item
         
-        return {
-            'chart_type': 'compliance_radar',
-            'plotly_json': fig.to_json(), 
-            'html': fig.to_html(include_plotlyjs='cdn'),
-            'summary': {
-                'overall_compliance_score': round(overall_compliance, 1),
-                'frameworks_assessed': len(frameworks) - 1,
-                'compliant_frameworks': len([fw for fw, data in framework_scores.items() if data['score'] >= 80])
-            }
-        }
+        return self._chart_result('compliance_radar', {'data': data, 'layout': layout}, include_html, serialize, {
+            'overall_compliance_score': round(overall_compliance, 1),
+            'frameworks_assessed': len(frameworks) - 1,
+            'compliant_frameworks': len([fw for fw, data in framework_scores.items() if data['score'] >= 80])
+        })
     
-    def create_performance_trends_chart(self, performance_data: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def create_performance_trends_chart(self, performance_data: List[Dict[str, Any]], include_html: bool = False,
+                                        serialize: bool = True) -> Dict[str, Any]:
         """Create performance trends over time"""
-        
-        if not performance_data:
-            # Generate sample trend data
-            dates = pd.date_range('2024-01-01', periods=30, freq='D')
-            performance_data = [
-                {
-                    'date': date.strftime('%Y-%m-%d'),
-                    'response_time': np.random.normal(200, 50),
-                    'throughput': np.random.normal(1000, 100),
-                    'error_rate': np.random.normal(2, 0.5),
-                    'availability': np.random.normal(99.5, 0.3)
-                }
-                for date in dates
-            ]
-        
-        df = pd.DataFrame(performance_data)
+        import numpy as np
+        
+        if performance_data:
+            dates = [point.get('date') for point in performance_data]
+            metrics = np.array([
+                [point.get(metric, np.nan) for metric in _PERFORMANCE_METRICS]
+                for point in performance_data
+            ], dtype=float).T
+        else:
+            # Sample trend data, shared read-only across calls
+            dates, metrics = _default_performance_data()
+        response_time, throughput, error_rate, availability = metrics
         
         # Create subplots
-        fig = make_subplots(
+        layout, cells = _subplot_grid(
             rows=2, cols=2,
             subplot_titles=(
                 'Response Time (ms)',
@@ -562,87 +667,100 @@ class PlotlyVisualizer:
             horizontal_spacing=0.1
         )
         
-        # Response Time
-        fig.add_trace(
-            go.Scatter(
-                x=df['date'],
-                y=df['response_time'],
+        data = [
+            # Response Time
+            dict(
+                type='scatter',
+                x=dates,
+                y=response_time.tolist(),
                 mode='lines+markers',
                 name='Response Time',
-                line=dict(color=self.colors['primary'], width=2),
-                fill='tonexty' if 'response_time' in df.columns else None
+                line=dict(color=COLORS['primary'], width=2),
+                fill='tonexty',
+                **cells[1, 1]
             ),
-            row=1, col=1
-        )
-        
-        # Throughput
-        fig.add_trace(
-            go.Scatter(
-                x=df['date'],
-                y=df['throughput'],
+            # Throughput
+            dict(
+                type='scatter',
+                x=dates,
+                y=throughput.tolist(),
                 mode='lines+markers',
                 name='Throughput',
-                line=dict(color=self.colors['success'], width=2)
+                line=dict(color=COLORS['success'], width=2),
+                **cells[1, 2]
             ),
-            row=1, col=2
-        )
-        
-        # Error Rate
-        fig.add_trace(
-            go.Scatter(
-                x=df['date'],
-                y=df['error_rate'],
+            # Error Rate
+            dict(
+                type='scatter',
+                x=dates,
+                y=error_rate.tolist(),
                 mode='lines+markers',
                 name='Error Rate',
-                line=dict(color=self.colors['danger'], width=2),
-                fill='tozeroy'
+                line=dict(color=COLORS['danger'], width=2),
+                fill='tozeroy',
+                **cells[2, 1]
             ),
-            row=2, col=1
-        )
-        
-        # Availability
-        fig.add_trace(
-            go.Scatter(
-                x=df['date'],
-                y=df['availability'],
+            # Availability
+            dict(
+                type='scatter',
+                x=dates,
+                y=availability.tolist(),
                 mode='lines+markers',
                 name='Availability',
-                line=dict(color=self.colors['info'], width=2)
-            ),
-            row=2, col=2
-        )
+                line=dict(color=COLORS['info'], width=2),
+                **cells[2, 2]
+            )
+        ]
         
-        fig.update_layout(
+        layout.update(
             title={
                 'text': 'Performance Trends Dashboard',
                 'x': 0.5
             },
             height=600,
             showlegend=False,
-            **self.layout_theme
+            **LAYOUT_THEME
         )
         
-        # Calculate performance summary
-        avg_response_time = df['response_time'].mean()
-        avg_throughput = df['throughput'].mean()
-        avg_error_rate = df['error_rate'].mean()
-        avg_availability = df['availability'].mean()
-        
-        return {
-            'chart_type': 'performance_trends',
-            'plotly_json': fig.to_json(),
-            'html': fig.to_html(include_plotlyjs='cdn'),
-            'summary': {
-                'avg_response_time': round(avg_response_time, 1),
-                'avg_throughput': round(avg_throughput, 0),
-                'avg_error_rate': round(avg_error_rate, 2),
-                'avg_availability': round(avg_availability, 2),
-                'performance_grade': self._get_grade(min(100, (100 - avg_response_time/10)))
-            }
-        }
+        # Calculate performance summary in one reduction over all metrics;
+        # a metric with no values keeps its default instead of becoming NaN
+        counts = np.count_nonzero(~np.isnan(metrics), axis=1)
+        avg_response_time, avg_throughput, avg_error_rate, avg_availability = np.divide(
+            np.nansum(metrics, axis=1), counts,
+            out=np.array(_PERFORMANCE_DEFAULTS, dtype=float), where=counts > 0
+        ).tolist()
+        
+        return self._chart_result('performance_trends', {'data': data, 'layout': layout}, include_html, serialize, {
+            'avg_response_time': round(avg_response_time, 1),
+            'avg_throughput': round(avg_throughput, 0),
+            'avg_error_rate': round(avg_error_rate, 2),
+            'avg_availability': round(avg_availability, 2),
+            'performance_grade': self._get_grade(min(100, (100 - avg_response_time/10)))
+        })
     
     def create_comprehensive_dashboard(self, analysis_results: Dict[str, Any]) -> Dict[str, Any]:
-        """Create comprehensive multi-chart dashboard"""
+        """Create comprehensive multi-chart dashboard.
+        
+        Each entry of 'charts' carries its Plotly figure as a plain dict under
+        'figure' (not a pre-encoded 'plotly_json' string as returned by the
+        individual chart methods); pass it to Plotly.newPlot as-is.
+        
+        Identical inputs reuse the cached charts. The cache holds the dashboard
+        JSON-encoded and every call, hit or miss, decodes its own copy, so callers
+        may mutate the result without affecting later calls.
+        """
+        cache_key = _dashboard_cache_key(analysis_results)
+        encoded = _dashboard_cache_lookup(cache_key)
+        if encoded is None:
+            encoded = pio.json.to_json_plotly(self._build_comprehensive_dashboard(analysis_results))
+            _dashboard_cache_store(cache_key, encoded)
+        
+        dashboard = _json_loads(encoded)
+        dashboard['generated_at'] = self._get_timestamp()
+        return dashboard
+    
+    def _build_comprehensive_dashboard(self, analysis_results: Dict[str, Any]) -> Dict[str, Any]:
+        """Build the dashboard charts and summary (without a timestamp)"""
         
         # Extract data from analysis results
         scores = analysis_results.get('score', {})
@@ -650,52 +768,66 @@ class PlotlyVisualizer:
         cost_data = analysis_results.get('estimated_cost', {})
         compliance_data = analysis_results.get('compliance_assessment', {})
         
-        # Generate individual charts
-        health_chart = self.create_architecture_health_score_chart(scores)
-        issues_chart = self.create_issues_severity_chart(issues)
-        cost_chart = self.create_cost_breakdown_chart(cost_data)
-        compliance_chart = self.create_compliance_radar_chart(compliance_data)
-        performance_chart = self.create_performance_trends_chart([])
+        # Generate individual charts; figures stay plain dicts so the response
+        # is JSON-encoded once, by the caller
+        charts = {
+            'health_scores': self.create_architecture_health_score_chart(scores, serialize=False),
+            'issues_analysis': self.create_issues_severity_chart(issues, serialize=False),
+            'cost_breakdown': self.create_cost_breakdown_chart(cost_data, serialize=False),
+            'compliance_assessment': self.create_compliance_radar_chart(compliance_data, serialize=False),
+            'performance_trends': self.create_performance_trends_chart([], serialize=False)
+        }
         
         return {
             'dashboard_type': 'comprehensive',
-            'charts': {
-                'health_scores': health_chart,
-                'issues_analysis': issues_chart,
-                'cost_breakdown': cost_chart,
-                'compliance_assessment': compliance_chart,
-                'performance_trends': performance_chart
-            },
+            'charts': charts,
             'summary': {
                 'overall_health': scores.get('overall', 75),
                 'total_issues': len(issues),
                 'estimated_monthly_cost': cost_data.get('monthly', 750),
                 'compliance_score': compliance_data.get('overall_compliance_score', 75)
-            },
-            'generated_at': self._get_timestamp()
+            }
         }
     
+    def _chart_result(self, chart_type: str, fig: Dict[str, Any], include_html: bool,
+                      serialize: bool, summary: Dict[str, Any]) -> Dict[str, Any]:
+        """Package a figure as a chart payload, rendering HTML only on request.
+        
+        With serialize=False the figure is returned as a plain dict under
+        'figure' so a caller aggregating several charts can encode the whole
+        response once instead of embedding pre-encoded JSON strings.
+        """
+        result = {'chart_type': chart_type}
+        if serialize:
+            result['plotly_json'] = self._to_json(fig)
+        else:
+            result['figure'] = fig
+        result['summary'] = summary
+        if include_html:
+            result['html'] = self._to_html(fig)
+        return result
+    
+    def _to_html(self, fig: Dict[str, Any]) -> str:
+        """Render a figure into the cached CDN HTML template"""
+        height = fig['layout'].get('height')
+        return _html_template().substitute(
+            div_id=str(uuid.uuid4()),
+            data=pio.json.to_json_plotly(fig['data'], engine=PLOTLY_JSON_ENGINE),
+            layout=pio.json.to_json_plotly(fig['layout'], engine=PLOTLY_JSON_ENGINE),
+            height='100%' if height is None else f'{height}px'
+        )
+    
+    def _to_json(self, fig: Dict[str, Any]) -> str:
+        """Serialize a figure with the fastest available JSON engine"""
+        return pio.to_json(fig, validate=False, engine=PLOTLY_JSON_ENGINE)
+    
     def _get_score_color(self, score: int) -> str:
         """Get color based on score value"""
-        if score >= 80:
-            return self.colors['success']
-        elif score >= 60:
-            return self.colors['warning'] 
-        else:
-            return self.colors['danger']
+        return _SCORE_COLORS[bisect_right(_SCORE_COLOR_THRESHOLDS, score)]
     
     def _get_grade(self, score: float) -> str:
         """Convert numeric score to letter grade"""
-        if score >= 90:
-            return 'A'
-        elif score >= 80:
-            return 'B'
-        elif score >= 70:
-            return 'C'
-        elif score >= 60:
-            return 'D'
-        else:
-            return 'F'
+        return _GRADES[bisect_right(_GRADE_THRESHOLDS, score)]
     
     def _get_timestamp(self) -> str:
         """Get current timestamp"""
@@ -708,24 +840,40 @@ class PlotlyVisualizer:
         os.makedirs(output_dir, exist_ok=True)
         
         exported_files = {}
+        figures = {}
         
         for chart_name, chart_data in charts.items():
             try:
-                if 'plotly_json' in chart_data:
-                    fig = go.Figure(json.loads(chart_data['plotly_json']))
-                    
-                    # Export as PNG
-                    png_path = os.path.join(output_dir, f"{chart_name}.png")
-                    fig.write_image(png_path, width=800, height=600)
-                    exported_files[f"{chart_name}_png"] = png_path
-                    
-                    # Export as HTML
-                    html_path = os.path.join(output_dir, f"{chart_name}.html")
-                    fig.write_html(html_path)
-                    exported_files[f"{chart_name}_html"] = html_path
-                    
+                # Plain figure dicts; the builders already emit valid specs
+                if 'figure' in chart_data:
+                    figures[chart_name] = chart_data['figure']
+                elif 'plotly_json' in chart_data:
+                    figures[chart_name] = _json_loads(chart_data['plotly_json'])
+            except Exception as e:
+                print(f"Failed to export chart {chart_name}: {e}")
+        
+        # Export all PNGs through one Kaleido browser session instead of one per chart
+        png_paths = {name: os.path.join(output_dir, f"{name}.png") for name in figures}
+        try:
+            pio.write_images(list(figures.values()), list(png_paths.values()),
+                             width=800, height=600, validate=False)
+        except Exception as e:
+            print(f"Batch image export failed, exporting charts individually: {e}")
+            for chart_name, fig in list(figures.items()):
+                try:
+                    pio.write_image(fig, png_paths[chart_name], width=800, height=600, validate=False)
+                except Exception as e:
+                    print(f"Failed to export chart {chart_name}: {e}")
+                    del figures[chart_name]
+        
+        for chart_name, fig in figures.items():
+            exported_files[f"{chart_name}_png"] = png_paths[chart_name]
+            try:
+                # Export as HTML
+                html_path = os.path.join(output_dir, f"{chart_name}.html")
+                pio.write_html(fig, html_path, validate=False)
+                exported_files[f"{chart_name}_html"] = html_path
             except Exception as e:
                 print(f"Failed to export chart {chart_name}: {e}")
-                continue
         
         return exported_files
\ No newline at end of file
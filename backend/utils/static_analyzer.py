@@ -3,71 +3,219 @@ StackStage Static Analysis Engine using Checkov + OPA
 Provides comprehensive security, compliance, and best-practice analysis for IaC
 """
 import os
+import re
+import copy
 import json
+import hashlib
+import threading
+import shutil
 import subprocess
-import tempfile
-from typing import Dict, List, Any, Optional
-from pathlib import Path
+from collections import Counter, OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
+from functools import cache, lru_cache
+from types import MappingProxyType
+from typing import Dict, List, Any, Mapping, Optional, Tuple
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+
+@cache
+def _checkov_path() -> Optional[str]:
+    """Resolve and probe the Checkov CLI once per process; None when unusable"""
+    path = shutil.which('checkov')
+    if path is not None:
+        try:
+            subprocess.run([path, '--version'],
+                           capture_output=True, check=True, timeout=10)
+            return path
+        except (subprocess.CalledProcessError, OSError, subprocess.TimeoutExpired):
+            pass
+    print("Checkov not available, using built-in analysis")
+    return None
+
+
+def _combine_patterns(patterns) -> Tuple[re.Pattern, Tuple[str, ...], tuple]:
+    """Fuse (name, anchor, regex, message, severity) rows into one named-group alternation.
+    
+    The content is then scanned once per analysis and matches are bucketed by
+    ``lastgroup``; the returned rows keep the declaration order for reporting.
+    Each branch sits inside a zero-width lookahead so a match never consumes
+    text another check could start in (``spec:.*containers:`` spans a whole
+    line). This relies on no two checks matching at the same offset: their
+    leading literals differ, and the two S3 ACL checks exclude each other.
+    Anchors are casefolded literals every match must contain, used to skip
+    the scan entirely for content that cannot match.
+    """
+    alternation = '(?=' + '|'.join(f'(?P<{name}>{regex})' for name, _, regex, _, _ in patterns) + ')'
+    # A lookahead on the possible first characters lets the scanner skip
+    # positions cheaply instead of trying every branch at every offset
+    first_chars = {regex[0].lower() for _, _, regex, _, _ in patterns}
+    if all(char.isalpha() for char in first_chars):
+        alternation = f"(?=[{''.join(sorted(first_chars))}]){alternation}"
+    # Consume the first character so the scan moves on without the extra
+    # retry Python's re makes after an empty match
+    alternation += '(?s:.)'
+    combined = re.compile(alternation, re.IGNORECASE | re.MULTILINE)
+    anchors = tuple(dict.fromkeys(anchor.casefold() for _, anchor, _, _, _ in patterns))
+    checks = tuple((name, message, severity) for name, _, _, message, severity in patterns)
+    return combined, anchors, checks
+
+
+# Built-in security patterns as (name, anchor, regex, message, severity) rows;
+# _PATTERN_SETS holds the fused form selected by IaC type in _built_in_analysis
+_TERRAFORM_PATTERNS = (
+    ('s3_public_read', 'public-read',
+     r'acl\s*=\s*["\']public-read["\']',
+     'S3 bucket allows public read access', 'high'),
+    ('s3_public_readwrite', 'public-read-write',
+     r'acl\s*=\s*["\']public-read-write["\']',
+     'S3 bucket allows public read-write access', 'critical'),
+    ('sg_all_ports', 'from_port',
+     r'from_port\s*=\s*0\s+to_port\s*=\s*65535',
+     'Security group allows all ports', 'high'),
+    ('sg_open_internet', '0.0.0.0/0',
+     r'cidr_blocks\s*=\s*\[\s*["\']0\.0\.0\.0/0["\']',
+     'Security group allows access from internet', 'medium'),
+    ('db_public_access', 'publicly_accessible',
+     r'publicly_accessible\s*=\s*true',
+     'Database is publicly accessible', 'high'),
+    ('encryption_disabled', 'encrypted',
+     r'encrypted\s*=\s*false',
+     'Encryption is disabled', 'medium'),
+)
+
+_K8S_PATTERNS = (
+    ('privileged_container', 'privileged:',
+     r'privileged:\s*true',
+     'Container runs in privileged mode', 'high'),
+    ('root_user', 'runasuser:',
+     r'runAsUser:\s*0',
+     'Container runs as root user', 'medium'),
+    ('host_network', 'hostnetwork:',
+     r'hostNetwork:\s*true',
+     'Pod uses host network', 'high'),
+    ('no_resource_limits', 'containers:',
+     r'spec:(?!.*limits).*containers:',
+     'Container has no resource limits', 'low'),
+)
+
+_GENERIC_PATTERNS = (
+    ('password_hardcoded', 'password',
+     r'password\s*[=:]\s*["\'][^"\']{8,}["\']',
+     'Hardcoded password detected', 'critical'),
+    ('api_key_hardcoded', 'api',
+     r'api[_-]?key\s*[=:]\s*["\'][A-Za-z0-9]{20,}["\']',
+     'Hardcoded API key detected', 'high'),
+)
+
+_PATTERN_SETS = {
+    'terraform': _combine_patterns(_TERRAFORM_PATTERNS),
+    'kubernetes': _combine_patterns(_K8S_PATTERNS),
+}
+_GENERIC_PATTERN_SET = _combine_patterns(_GENERIC_PATTERNS)
+
+# Checkov --framework value for each supported IaC type
+CHECKOV_FRAMEWORKS = {
+    'terraform': 'terraform',
+    'cloudformation': 'cloudformation',
+    'kubernetes': 'kubernetes',
+    'docker-compose': 'docker_compose'
+}
+CHECKOV_TIMEOUT = 30  # seconds per scanned file
+
+# Checkov severity levels mapped to StackStage levels; unknown levels count as medium
+_SEVERITY_MAP = {
+    'CRITICAL': 'critical',
+    'HIGH': 'high',
+    'MEDIUM': 'medium',
+    'LOW': 'low',
+    'INFO': 'info'
+}
+
+# Keywords in a failed check's id or name that count against each framework
+_COMPLIANCE_KEYWORDS = {
+    'SOC2': ('encryption', 'access', 'public', 'logging'),
+    'GDPR': ('encryption', 'data', 'privacy', 'access'),
+    'HIPAA': ('encryption', 'access', 'audit', 'security'),
+}
+
+# Inverted view: each distinct keyword and the frameworks it affects, so a
+# failed check is scanned once per keyword rather than once per framework
+_KEYWORD_FRAMEWORKS = {
+    keyword: frozenset(framework for framework, framework_keywords in _COMPLIANCE_KEYWORDS.items()
+                       if keyword in framework_keywords)
+    for keywords in _COMPLIANCE_KEYWORDS.values() for keyword in keywords
+}
+
+# Passed Checkov checks are only counted; this many are kept as examples
+PASSED_CHECKS_SAMPLE_SIZE = 10
+
+# Default OPA-style policies for infrastructure analysis; read-only at the top
+# level and shared by every analyzer instead of rebuilt per instance
+DEFAULT_POLICIES = MappingProxyType({
+    'aws_security_policies': {
+        's3_public_access': {
+            'rule': 'S3 buckets should not allow public access',
+            'severity': 'HIGH',
+            'description': 'Public S3 buckets can lead to data breaches'
+        },
+        'ec2_security_groups': {
+            'rule': 'Security groups should not allow unrestricted access',
+            'severity': 'HIGH', 
+            'description': 'Open security groups increase attack surface'
+        },
+        'rds_encryption': {
+            'rule': 'RDS instances should be encrypted',
+            'severity': 'MEDIUM',
+            'description': 'Database encryption protects sensitive data'
+        },
+        'iam_root_access': {
+            'rule': 'Root access keys should not be used',
+            'severity': 'CRITICAL',
+            'description': 'Root access keys pose significant security risk'
+        }
+    },
+    'compliance_frameworks': {
+        'SOC2': ['encryption_at_rest', 'encryption_in_transit', 'access_controls', 'logging'],
+        'HIPAA': ['data_encryption', 'access_logging', 'network_segmentation'],
+        'GDPR': ['data_encryption', 'access_controls', 'data_retention'],
+        'PCI_DSS': ['network_segmentation', 'encryption', 'access_controls', 'monitoring']
+    },
+    'cost_optimization': {
+        'unused_resources': {
+            'rule': 'Identify potentially unused resources',
+            'description': 'Unused resources incur unnecessary costs'
+        },
+        'right_sizing': {
+            'rule': 'Resources should be appropriately sized',
+            'description': 'Over-provisioned resources waste money'
+        }
+    }
+})
+
+# Number of analyze_content results kept per analyzer, keyed by content digest
+ANALYSIS_CACHE_SIZE = 128
+
 
 class StaticAnalyzer:
     """Enhanced static analysis using Checkov and OPA (Open Policy Agent)"""
     
     def __init__(self):
-        self.checkov_available = self._check_checkov_availability()
+        self.checkov_path = _checkov_path()
+        self.checkov_available = self.checkov_path is not None
         self.opa_policies = self._load_default_policies()
-        
-    def _check_checkov_availability(self) -> bool:
-        """Check if Checkov is available in the system"""
-        try:
-            subprocess.run(['checkov', '--version'], 
-                         capture_output=True, check=True, timeout=10)
-            return True
-        except (subprocess.CalledProcessError, FileNotFoundError, subprocess.TimeoutExpired):
-            print("Checkov not available, using built-in analysis")
-            return False
+        self._result_cache: "OrderedDict[bytes, Dict[str, Any]]" = OrderedDict()
+        self._in_flight: Dict[bytes, threading.Event] = {}
+        self._result_lock = threading.Lock()
     
-    def _load_default_policies(self) -> Dict[str, Any]:
+    def _load_default_policies(self) -> Mapping[str, Any]:
         """Load default OPA-style policies for infrastructure analysis"""
-        return {
-            'aws_security_policies': {
-                's3_public_access': {
-                    'rule': 'S3 buckets should not allow public access',
-                    'severity': 'HIGH',
-                    'description': 'Public S3 buckets can lead to data breaches'
-                },
-                'ec2_security_groups': {
-                    'rule': 'Security groups should not allow unrestricted access',
-                    'severity': 'HIGH', 
-                    'description': 'Open security groups increase attack surface'
-                },
-                'rds_encryption': {
-                    'rule': 'RDS instances should be encrypted',
-                    'severity': 'MEDIUM',
-                    'description': 'Database encryption protects sensitive data'
-                },
-                'iam_root_access': {
-                    'rule': 'Root access keys should not be used',
-                    'severity': 'CRITICAL',
-                    'description': 'Root access keys pose significant security risk'
-                }
-            },
-            'compliance_frameworks': {
-                'SOC2': ['encryption_at_rest', 'encryption_in_transit', 'access_controls', 'logging'],
-                'HIPAA': ['data_encryption', 'access_logging', 'network_segmentation'],
-                'GDPR': ['data_encryption', 'access_controls', 'data_retention'],
-                'PCI_DSS': ['network_segmentation', 'encryption', 'access_controls', 'monitoring']
-            },
-            'cost_optimization': {
-                'unused_resources': {
-                    'rule': 'Identify potentially unused resources',
-                    'description': 'Unused resources incur unnecessary costs'
-                },
-                'right_sizing': {
-                    'rule': 'Resources should be appropriately sized',
-                    'description': 'Over-provisioned resources waste money'
-                }
-            }
-        }
+        return DEFAULT_POLICIES
     
     def run_checkov_analysis(self, file_path: str, iac_type: str) -> Dict[str, Any]:
         """Run Checkov analysis on infrastructure code"""
@@ -76,18 +224,11 @@ class StaticAnalyzer:
         
         try:
             # Determine checkov framework based on IaC type
-            framework_map = {
-                'terraform': 'terraform',
-                'cloudformation': 'cloudformation',
-                'kubernetes': 'kubernetes',
-                'docker-compose': 'docker_compose'
-            }
-            
-            framework = framework_map.get(iac_type, 'terraform')
+            framework = CHECKOV_FRAMEWORKS.get(iac_type, 'terraform')
             
             # Run Checkov with JSON output
             cmd = [
-                'checkov',
+                self.checkov_path,
                 '-f', file_path,
                 '--framework', framework,
                 '--output', 'json',
@@ -95,15 +236,15 @@ class StaticAnalyzer:
                 '--quiet'       # Reduce verbose output
             ]
             
+            # Keep stdout as bytes; the JSON parser decodes it directly
             result = subprocess.run(
                 cmd, 
                 capture_output=True, 
-                text=True, 
-                timeout=30
+                timeout=CHECKOV_TIMEOUT
             )
             
             if result.stdout:
-                checkov_results = json.loads(result.stdout)
+                checkov_results = _json_loads(result.stdout)
                 return self._process_checkov_results(checkov_results)
             else:
                 return self._fallback_analysis(file_path, iac_type)
@@ -112,6 +253,62 @@ class StaticAnalyzer:
             print(f"Checkov analysis failed: {e}")
             return self._fallback_analysis(file_path, iac_type)
     
+    def run_checkov_batch(self, files: List[str], iac_type: str) -> Dict[str, Dict[str, Any]]:
+        """Run a single Checkov process over several files of one IaC type.
+        
+        Checkov's startup dominates small scans, so every file is passed with
+        its own -f flag and the consolidated report is split back per file
+        using the path recorded on each check.
+        """
+        if not files:
+            return {}
+        if not self.checkov_available:
+            return {file_path: self._fallback_analysis(file_path, iac_type) for file_path in files}
+        
+        cmd = [
+            self.checkov_path,
+            '--framework', CHECKOV_FRAMEWORKS.get(iac_type, 'terraform'),
+            '--output', 'json',
+            '--soft-fail',
+            '--quiet'
+        ]
+        for file_path in files:
+            cmd.extend(['-f', file_path])
+        
+        try:
+            result = subprocess.run(
+                cmd,
+                capture_output=True,
+                timeout=CHECKOV_TIMEOUT * len(files)
+            )
+            checkov_results = _json_loads(result.stdout) if result.stdout else None
+        except (subprocess.CalledProcessError, json.JSONDecodeError, subprocess.TimeoutExpired) as e:
+            print(f"Checkov batch analysis failed: {e}")
+            checkov_results = None
+        
+        if not checkov_results:
+            return {file_path: self._fallback_analysis(file_path, iac_type) for file_path in files}
+        
+        # Checkov emits one report per check type, as a list when there are several
+        reports = checkov_results if isinstance(checkov_results, list) else [checkov_results]
+        per_file = {
+            os.path.abspath(file_path): {'failed_checks': [], 'passed_checks': []}
+            for file_path in files
+        }
+        for report in reports:
+            results = report.get('results', {})
+            for bucket in ('failed_checks', 'passed_checks'):
+                for check in results.get(bucket, []):
+                    check_path = check.get('file_abs_path') or check.get('file_path', '')
+                    file_results = per_file.get(os.path.abspath(check_path))
+                    if file_results is not None:
+                        file_results[bucket].append(check)
+        
+        return {
+            file_path: self._process_checkov_results({'results': per_file[os.path.abspath(file_path)]})
+            for file_path in files
+        }
+    
     def _process_checkov_results(self, checkov_results: Dict[str, Any]) -> Dict[str, Any]:
         """Process Checkov results into StackStage format"""
         processed = {
@@ -123,7 +320,7 @@ class StaticAnalyzer:
                 'skipped_checks': 0
             },
             'failed_checks': [],
-            'passed_checks': [],
+            'passed_checks_sample': [],
             'compliance_status': {},
             'security_score': 0
         }
@@ -131,30 +328,35 @@ class StaticAnalyzer:
         # Process check results
         results = checkov_results.get('results', {})
         
-        if 'failed_checks' in results:
-            for failed_check in results['failed_checks']:
-                processed['failed_checks'].append({
-                    'check_id': failed_check.get('check_id', 'unknown'),
-                    'check_name': failed_check.get('check_name', 'Unknown Check'),
-                    'severity': self._map_checkov_severity(failed_check.get('severity', 'MEDIUM')),
-                    'description': failed_check.get('description', ''),
-                    'file_path': failed_check.get('file_path', ''),
-                    'line_range': failed_check.get('file_line_range', []),
-                    'resource': failed_check.get('resource', ''),
-                    'guideline': failed_check.get('guideline', '')
-                })
+        severity_get = _SEVERITY_MAP.get
+        processed['failed_checks'] = [
+            {
+                'check_id': failed_check.get('check_id', 'unknown'),
+                'check_name': failed_check.get('check_name', 'Unknown Check'),
+                'severity': severity_get((failed_check.get('severity') or 'MEDIUM').upper(), 'medium'),
+                'description': failed_check.get('description', ''),
+                'file_path': failed_check.get('file_path', ''),
+                'line_range': failed_check.get('file_line_range', []),
+                'resource': failed_check.get('resource', ''),
+                'guideline': failed_check.get('guideline', '')
+            }
+            for failed_check in results.get('failed_checks', [])
+        ]
         
-        if 'passed_checks' in results:
-            for passed_check in results['passed_checks']:
-                processed['passed_checks'].append({
-                    'check_id': passed_check.get('check_id', 'unknown'),
-                    'check_name': passed_check.get('check_name', 'Unknown Check'),
-                    'resource': passed_check.get('resource', '')
-                })
+        # Large scans pass thousands of checks; count them all but only keep a sample
+        passed_checks = results.get('passed_checks', [])
+        processed['passed_checks_sample'] = [
+            {
+                'check_id': passed_check.get('check_id', 'unknown'),
+                'check_name': passed_check.get('check_name', 'Unknown Check'),
+                'resource': passed_check.get('resource', '')
+            }
+            for passed_check in passed_checks[:PASSED_CHECKS_SAMPLE_SIZE]
+        ]
         
         # Calculate summary
         processed['summary']['failed_checks'] = len(processed['failed_checks'])
-        processed['summary']['passed_checks'] = len(processed['passed_checks'])
+        processed['summary']['passed_checks'] = len(passed_checks)
         processed['summary']['total_checks'] = processed['summary']['failed_checks'] + processed['summary']['passed_checks']
         
         # Calculate security score (0-100)
@@ -167,17 +369,6 @@ class StaticAnalyzer:
         
         return processed
     
-    def _map_checkov_severity(self, severity: str) -> str:
-        """Map Checkov severity levels to StackStage levels"""
-        severity_map = {
-            'CRITICAL': 'critical',
-            'HIGH': 'high',
-            'MEDIUM': 'medium',
-            'LOW': 'low',
-            'INFO': 'info'
-        }
-        return severity_map.get(severity.upper(), 'medium')
-    
     def _fallback_analysis(self, file_path: str, iac_type: str) -> Dict[str, Any]:
         """Fallback analysis when Checkov is not available"""
         try:
@@ -202,92 +393,33 @@ class StaticAnalyzer:
             'compliance_status': {}
         }
         
-        # Define security patterns based on IaC type
-        if iac_type == 'terraform':
-            patterns = {
-                's3_public_read': {
-                    'pattern': r'acl\s*=\s*["\']public-read["\']',
-                    'message': 'S3 bucket allows public read access',
-                    'severity': 'high'
-                },
-                's3_public_readwrite': {
-                    'pattern': r'acl\s*=\s*["\']public-read-write["\']',
-                    'message': 'S3 bucket allows public read-write access', 
-                    'severity': 'critical'
-                },
-                'sg_all_ports': {
-                    'pattern': r'from_port\s*=\s*0\s+to_port\s*=\s*65535',
-                    'message': 'Security group allows all ports',
-                    'severity': 'high'
-                },
-                'sg_open_internet': {
-                    'pattern': r'cidr_blocks\s*=\s*\[\s*["\']0\.0\.0\.0/0["\']',
-                    'message': 'Security group allows access from internet',
-                    'severity': 'medium'
-                },
-                'db_public_access': {
-                    'pattern': r'publicly_accessible\s*=\s*true',
-                    'message': 'Database is publicly accessible',
-                    'severity': 'high'
-                },
-                'encryption_disabled': {
-                    'pattern': r'encrypted\s*=\s*false',
-                    'message': 'Encryption is disabled',
-                    'severity': 'medium'
-                }
-            }
+        combined, anchors, checks = _PATTERN_SETS.get(iac_type, _GENERIC_PATTERN_SET)
         
-        elif iac_type == 'kubernetes':
-            patterns = {
-                'privileged_container': {
-                    'pattern': r'privileged:\s*true',
-                    'message': 'Container runs in privileged mode',
-                    'severity': 'high'
-                },
-                'root_user': {
-                    'pattern': r'runAsUser:\s*0',
-                    'message': 'Container runs as root user',
-                    'severity': 'medium'
-                },
-                'host_network': {
-                    'pattern': r'hostNetwork:\s*true',
-                    'message': 'Pod uses host network',
-                    'severity': 'high'
-                },
-                'no_resource_limits': {
-                    'pattern': r'spec:(?!.*limits).*containers:',
-                    'message': 'Container has no resource limits',
-                    'severity': 'low'
-                }
-            }
-        
-        else:
-            # Generic patterns
-            patterns = {
-                'password_hardcoded': {
-                    'pattern': r'password\s*[=:]\s*["\'][^"\']{8,}["\']',
-                    'message': 'Hardcoded password detected',
-                    'severity': 'critical'
-                },
-                'api_key_hardcoded': {
-                    'pattern': r'api[_-]?key\s*[=:]\s*["\'][A-Za-z0-9]{20,}["\']',
-                    'message': 'Hardcoded API key detected',
-                    'severity': 'high'
-                }
-            }
+        # Scan the content once and bucket matches by the check that hit;
+        # most files contain none of the anchor literals and skip the regex
+        buckets: Dict[str, List[str]] = {}
+        folded = content.casefold()
+        if any(anchor in folded for anchor in anchors):
+            match_ends: Dict[str, int] = {}
+            for match in combined.finditer(content):
+                check_name = match.lastgroup
+                start, end = match.span(check_name)
+                # Like a per-check findall, skip hits inside this check's previous match
+                if start < match_ends.get(check_name, 0):
+                    continue
+                match_ends[check_name] = end
+                buckets.setdefault(check_name, []).append(match.group(check_name))
         
-        # Check patterns against content
-        import re
-        for check_name, check_info in patterns.items():
-            matches = re.findall(check_info['pattern'], content, re.IGNORECASE | re.MULTILINE)
+        for check_name, message, severity in checks:
+            matches = buckets.get(check_name)
             analysis_results['summary']['total_checks'] += 1
             
             if matches:
                 analysis_results['failed_checks'].append({
                     'check_id': f'BUILTIN_{check_name.upper()}',
                     'check_name': check_name.replace('_', ' ').title(),
-                    'severity': check_info['severity'],
-                    'description': check_info['message'],
+                    'severity': severity,
+                    'description': message,
                     'matches': len(matches),
                     'evidence': matches[:3]  # Show first 3 matches as evidence
                 })
@@ -300,12 +432,11 @@ class StaticAnalyzer:
         if total_checks > 0:
             passed_ratio = analysis_results['summary']['passed_checks'] / total_checks
             # Adjust score based on severity of failed checks
-            critical_fails = len([c for c in analysis_results['failed_checks'] if c['severity'] == 'critical'])
-            high_fails = len([c for c in analysis_results['failed_checks'] if c['severity'] == 'high'])
+            severity_counts = Counter(c['severity'] for c in analysis_results['failed_checks'])
             
             score = int(passed_ratio * 100)
-            score -= critical_fails * 20  # -20 for each critical
-            score -= high_fails * 10      # -10 for each high
+            score -= severity_counts['critical'] * 20  # -20 for each critical
+            score -= severity_counts['high'] * 10      # -10 for each high
             analysis_results['security_score'] = max(0, score)
         
         return analysis_results
@@ -342,30 +473,22 @@ class StaticAnalyzer:
             }
         }
         
+        # Bucket failed checks by framework in a single pass
+        issues_by_framework: Dict[str, List[Dict[str, Any]]] = {framework: [] for framework in frameworks}
+        for failed_check in failed_checks:
+            # Simple mapping based on keywords; the newline keeps a keyword
+            # from matching across the id/name boundary
+            haystack = f"{failed_check.get('check_id', '').lower()}\n{failed_check.get('check_name', '').lower()}"
+            matched_frameworks = set()
+            for keyword, keyword_frameworks in _KEYWORD_FRAMEWORKS.items():
+                if keyword in haystack:
+                    matched_frameworks |= keyword_frameworks
+            for framework in matched_frameworks.intersection(issues_by_framework):
+                issues_by_framework[framework].append(failed_check)
+        
         # Calculate compliance scores
         for framework in frameworks:
-            framework_issues = []
-            
-            # Check for framework-specific violations
-            for failed_check in failed_checks:
-                check_id = failed_check.get('check_id', '').lower()
-                check_name = failed_check.get('check_name', '').lower()
-                
-                # Simple mapping based on keywords
-                if framework == 'SOC2':
-                    if any(keyword in check_id or keyword in check_name 
-                          for keyword in ['encryption', 'access', 'public', 'logging']):
-                        framework_issues.append(failed_check)
-                
-                elif framework == 'GDPR':
-                    if any(keyword in check_id or keyword in check_name
-                          for keyword in ['encryption', 'data', 'privacy', 'access']):
-                        framework_issues.append(failed_check)
-                
-                elif framework == 'HIPAA':
-                    if any(keyword in check_id or keyword in check_name
-                          for keyword in ['encryption', 'access', 'audit', 'security']):
-                        framework_issues.append(failed_check)
+            framework_issues = issues_by_framework[framework]
             
             # Calculate framework compliance score
             total_possible_score = 100
@@ -401,7 +524,10 @@ class StaticAnalyzer:
         # Run Checkov analysis
         checkov_results = self.run_checkov_analysis(file_path, iac_type)
         
-        # Run compliance analysis
+        return self._build_report(checkov_results)
+    
+    def _build_report(self, checkov_results: Dict[str, Any]) -> Dict[str, Any]:
+        """Run compliance analysis over static results and combine them"""
         compliance_results = self.analyze_compliance(checkov_results)
         
         # Combine results
@@ -412,10 +538,10 @@ class StaticAnalyzer:
                 'total_issues': checkov_results.get('summary', {}).get('failed_checks', 0),
                 'security_score': checkov_results.get('security_score', 85),
                 'compliance_score': compliance_results.get('overall_compliance_score', 85),
-                'critical_issues': len([
-                    issue for issue in checkov_results.get('failed_checks', [])
+                'critical_issues': sum(
+                    1 for issue in checkov_results.get('failed_checks', [])
                     if issue.get('severity') == 'critical'
-                ])
+                )
             },
             'timestamp': self._get_timestamp(),
             'analyzer_version': '1.0.0'
@@ -423,8 +549,81 @@ class StaticAnalyzer:
         
         return complete_analysis
     
+    def analyze_files(self, items: List[Tuple[str, str]],
+                      max_workers: Optional[int] = None) -> Dict[str, Dict[str, Any]]:
+        """Analyze several (file_path, iac_type) pairs.
+        
+        Files are grouped by IaC type so each group costs one Checkov
+        process (see run_checkov_batch), and the groups run concurrently on
+        threads since each mostly waits on its subprocess. Results are keyed
+        by file path in the order the items were given.
+        """
+        if not items:
+            return {}
+        
+        files_by_type: Dict[str, List[str]] = {}
+        for file_path, iac_type in items:
+            files_by_type.setdefault(iac_type, []).append(file_path)
+        
+        static_results: Dict[str, Dict[str, Any]] = {}
+        with ThreadPoolExecutor(max_workers=max_workers or os.cpu_count()) as executor:
+            futures = [
+                executor.submit(self.run_checkov_batch, files, iac_type)
+                for iac_type, files in files_by_type.items()
+            ]
+            for future in as_completed(futures):
+                static_results.update(future.result())
+        
+        return {file_path: self._build_report(static_results[file_path]) for file_path, _ in items}
+    
     def analyze_content(self, content: str, iac_type: str) -> Dict[str, Any]:
-        """Analyze content directly without file"""
+        """Analyze content directly without file.
+        
+        Results are cached by a digest of the IaC type and content, and
+        concurrent calls for the same input wait for the first one instead
+        of scanning it again. The cache keeps its own copy of each report
+        and every caller gets an independent one.
+        """
+        cache_key = hashlib.blake2b(
+            f'{iac_type}\0{content}'.encode('utf-8'), digest_size=16
+        ).digest()
+        
+        while True:
+            with self._result_lock:
+                cached = self._result_cache.get(cache_key)
+                if cached is not None:
+                    self._result_cache.move_to_end(cache_key)
+                    result = copy.deepcopy(cached)
+                    result['timestamp'] = self._get_timestamp()
+                    return result
+                pending = self._in_flight.get(cache_key)
+                if pending is None:
+                    pending = self._in_flight[cache_key] = threading.Event()
+                    break
+            # Another thread is analyzing the same input; if it fails, the
+            # next loop iteration finds no result and takes over
+            pending.wait()
+        
+        try:
+            result = self._analyze_content_uncached(content, iac_type)
+            with self._result_lock:
+                self._result_cache[cache_key] = copy.deepcopy(result)
+                if len(self._result_cache) > ANALYSIS_CACHE_SIZE:
+                    self._result_cache.popitem(last=False)
+            return result
+        finally:
+            with self._result_lock:
+                del self._in_flight[cache_key]
+            pending.set()
+    
+    def _analyze_content_uncached(self, content: str, iac_type: str) -> Dict[str, Any]:
+        """Run the full analysis on content, via a temporary file only when Checkov needs one"""
+        if not self.checkov_available:
+            # The built-in rules work on the text itself, so skip the disk round-trip
+            return self._build_report(self._built_in_analysis(content, iac_type))
+        
+        import tempfile
+        
         # Create temporary file for analysis
         with tempfile.NamedTemporaryFile(mode='w', suffix=f'.{iac_type}', delete=False) as tmp_file:
             tmp_file.write(content)
@@ -441,9 +640,15 @@ class StaticAnalyzer:
     
     def _get_timestamp(self) -> str:
         """Get current timestamp"""
-        from datetime import datetime
         return datetime.now().isoformat()
 
+
+@lru_cache(maxsize=1)
+def get_analyzer() -> StaticAnalyzer:
+    """Shared StaticAnalyzer, so callers reuse one Checkov probe and result cache"""
+    return StaticAnalyzer()
+
+
 # Example OPA policies (for future implementation)
 OPA_POLICIES = {
     "terraform_s3_policy": """
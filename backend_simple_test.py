@@ -3,6 +3,7 @@
 
 import sys
 import os
+import asyncio
 
 # Add backend to path
 sys.path.insert(0, 'backend')
@@ -21,27 +22,37 @@ async def test_backend_functionality():
         print(f"✗ Import error: {e}")
         return
     
+    test_data = AnalyzeRequest(
+        architecture_text="A simple web application with load balancer, web servers, and MySQL database",
+        user_region="us-east-1"
+    )
+    
+    # Both calls spend their time waiting on OpenRouter. The engine makes
+    # blocking HTTP requests inside its coroutines, so each runs on its own
+    # worker thread and event loop to let the round-trips overlap.
+    analysis_result, chat_result = await asyncio.gather(
+        asyncio.to_thread(asyncio.run, analyze_architecture(test_data)),
+        asyncio.to_thread(asyncio.run, assistant_chat("What are the best practices for AWS security?")),
+        return_exceptions=True
+    )
+    
     # Test analysis function
-    try:
-        test_data = AnalyzeRequest(
-            architecture_text="A simple web application with load balancer, web servers, and MySQL database",
-            user_region="us-east-1"
-        )
-        
-        result = await analyze_architecture(test_data)
-        print(f"✓ Analysis test: Score {result['score']}, {len(result['issues'])} issues, {len(result['recommendations'])} recommendations")
-        
-    except Exception as e:
-        print(f"✗ Analysis test failed: {e}")
+    if isinstance(analysis_result, Exception):
+        print(f"✗ Analysis test failed: {analysis_result}")
+    else:
+        try:
+            print(f"✓ Analysis test: Score {analysis_result['score']}, {len(analysis_result['issues'])} issues, {len(analysis_result['recommendations'])} recommendations")
+        except Exception as e:
+            print(f"✗ Analysis test failed: {e}")
     
     # Test assistant function
-    try:
-        result = await assistant_chat("What are the best practices for AWS security?")
-        print(f"✓ Assistant test: Response length {len(result['response'])} chars, {len(result['suggestions'])} suggestions")
-        
-    except Exception as e:
-        print(f"✗ Assistant test failed: {e}")
+    if isinstance(chat_result, Exception):
+        print(f"✗ Assistant test failed: {chat_result}")
+    else:
+        try:
+            print(f"✓ Assistant test: Response length {len(chat_result['response'])} chars, {len(chat_result['suggestions'])} suggestions")
+        except Exception as e:
+            print(f"✗ Assistant test failed: {e}")
 
 if __name__ == "__main__":
-    import asyncio
     asyncio.run(test_backend_functionality())
\ No newline at end of file
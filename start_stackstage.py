@@ -11,12 +11,40 @@ import time
 import signal
 from pathlib import Path
 
+BACKEND_DIR = Path(__file__).parent / "backend"
+
+def _uvicorn_command(*extra_args):
+    """Build the uvicorn command line shared by the dev and prod launchers"""
+    return [
+        sys.executable, "-m", "uvicorn", 
+        "main:app", 
+        "--host", "0.0.0.0", 
+        "--port", "8000",
+        *extra_args
+    ]
+
+def _launch_backend(cmd):
+    """Spawn uvicorn in the backend directory.
+    
+    Output goes straight to this terminal: nothing here drains a pipe, and
+    an unread one fills up and stalls the server once its buffer is full.
+    """
+    return subprocess.Popen(cmd, cwd=BACKEND_DIR)
+
+def start_dev():
+    """Single auto-reloading worker for local development"""
+    return _launch_backend(_uvicorn_command("--reload"))
+
+def start_prod():
+    """One worker process per CPU so concurrent analyses do not share a GIL"""
+    workers = os.cpu_count() or 1
+    print(f"⚙️  Production mode: {workers} uvicorn workers")
+    return _launch_backend(_uvicorn_command("--workers", str(workers)))
+
 def start_fastapi_backend():
     """Start the FastAPI backend server"""
     print("🚀 Starting FastAPI Backend on port 8000...")
     
-    backend_dir = Path(__file__).parent / "backend"
-    
     # Check if OpenRouter API key exists
     api_key = os.getenv("OPENROUTER_API_KEY")
     if not api_key:
@@ -24,24 +52,10 @@ def start_fastapi_backend():
     else:
         print("🔑 OpenRouter API Key: ✅ Found")
     
-    # Start FastAPI backend
-    cmd = [
-        sys.executable, "-m", "uvicorn", 
-        "main:app", 
-        "--host", "0.0.0.0", 
-        "--port", "8000",
-        "--reload"
-    ]
-    
-    backend_process = subprocess.Popen(
-        cmd,
-        cwd=backend_dir,
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
-        text=True
-    )
-    
-    return backend_process
+    # STACKSTAGE_ENV=production drops --reload in favour of multiple workers
+    if os.getenv("STACKSTAGE_ENV", "development").lower() == "production":
+        return start_prod()
+    return start_dev()
 
 def main():
     print("🌟 Starting StackStage Complete Application...")
@@ -5,30 +5,44 @@ import sys
 import os
 import requests
 import json
+from concurrent.futures import ThreadPoolExecutor
 
 # Add backend directory to path
 sys.path.insert(0, 'backend')
 
+def _probe(url):
+    """GET a URL on its own session: requests.Session is not safe to share across threads"""
+    with requests.Session() as probe_session:
+        return probe_session.get(url, timeout=5)
+
 def test_backend():
     print("Testing StackStage FastAPI Backend...")
     
     # Test basic endpoints
     base_url = "http://localhost:8000"
     
+    # One session reuses the TCP connection to the backend across the sequential requests
+    session = requests.Session()
+    
     try:
         # Test root endpoint
-        response = requests.get(f"{base_url}/", timeout=5)
+        response = session.get(f"{base_url}/", timeout=5)
         print(f"Root endpoint: {response.status_code} - {response.json()}")
         
-        # Test health endpoints
+        # Test health endpoints concurrently so their timeouts overlap, one session per probe
         endpoints = ["/api/analyze/health", "/api/assistant/health", "/api/diagram/health", "/api/export/health"]
         
-        for endpoint in endpoints:
-            try:
-                response = requests.get(f"{base_url}{endpoint}", timeout=5)
-                print(f"{endpoint}: {response.status_code} - {response.json()}")
-            except Exception as e:
-                print(f"{endpoint}: Error - {str(e)}")
+        with ThreadPoolExecutor(max_workers=len(endpoints)) as executor:
+            futures = {
+                endpoint: executor.submit(_probe, f"{base_url}{endpoint}")
+                for endpoint in endpoints
+            }
+            for endpoint, future in futures.items():
+                try:
+                    response = future.result()
+                    print(f"{endpoint}: {response.status_code} - {response.json()}")
+                except Exception as e:
+                    print(f"{endpoint}: Error - {str(e)}")
         
         # Test analyze endpoint with sample data
         analyze_data = {
@@ -37,7 +51,7 @@ def test_backend():
         }
         
         try:
-            response = requests.post(f"{base_url}/api/analyze/", 
+            response = session.post(f"{base_url}/api/analyze/", 
                                    json=analyze_data, 
                                    timeout=30)
             if response.status_code == 200: